@@ -1,13 +1,18 @@
+import asyncio
+import io
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timezone, timedelta
 
-from clients import BinanceClient, HyperliquidClient, DerivClient
+from clients import AsyncRuntime, BinanceClient, HyperliquidClient, DerivClient
 
 
-def inject_css() -> None:
-    st.markdown(
-        """
+_CSS = """
     <style>
     body, .stApp, [data-testid="stAppViewContainer"], .main {
         background-color: #020617 !important;
@@ -148,24 +153,112 @@ def inject_css() -> None:
         margin-top: 6px;
     }
     </style>
-    """,
-        unsafe_allow_html=True,
+    """
+
+
+_HEADER_HTML = """
+        <header>
+            <h1>Funding Rate Arbitrage Monitor</h1>
+            <p class="header-subtitle">
+                Real-time funding rate comparison between Binance, Hyperliquid and Deriv perpetuals
+            </p>
+        </header>
+        """
+
+_ALERT_HTML = """
+        <div class="alert-info">
+            Info: This dashboard shows live BTC funding rates and the best long/short combo across Binance, Hyperliquid and Deriv.
+        </div>
+        """
+
+_METRICS_TMPL = """
+    <div class="metrics-grid">
+      <div class="metric-card">
+        <div class="metric-label">Opportunities Found</div>
+        <div class="metric-value">{opportunities_found}</div>
+        <div class="metric-sublabel">
+            Spread greater or equal to {min_spread_pct:.2f}% (all timestamps)
+        </div>
+      </div>
+      <div class="metric-card">
+        <div class="metric-label">Avg Spread</div>
+        <div class="metric-value metric-positive">{avg_spread_pct:.4f}%</div>
+        <div class="metric-sublabel">Average spread over lookback window</div>
+      </div>
+      <div class="metric-card">
+        <div class="metric-label">Max Spread</div>
+        <div class="metric-value metric-positive">{max_spread_pct:.4f}%</div>
+        <div class="metric-sublabel">Maximum observed spread</div>
+      </div>
+      <div class="metric-card">
+        <div class="metric-label">Last Updated</div>
+        <div class="metric-value">{ts_str}</div>
+        <div class="metric-sublabel">UTC time of last data fetch</div>
+      </div>
+    </div>
+    """
+
+_CSV_WRITE_OPTIONS = pacsv.WriteOptions(include_header=False, quoting_style="none")
+
+
+def inject_css() -> None:
+    # Streamlit drops elements not re-emitted on a rerun, so this still runs
+    # every time; the string itself is built once at import.
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def _clients() -> tuple[AsyncRuntime, BinanceClient, HyperliquidClient, DerivClient]:
+    # The AsyncClient is bound to the loop that drives it, so both live in
+    # one resource; clearing the cache replaces them together.
+    runtime = AsyncRuntime()
+    return (
+        runtime,
+        BinanceClient(async_client=runtime.client),
+        HyperliquidClient(async_client=runtime.client),
+        DerivClient(async_client=runtime.client),
     )
 
 
-def fetch_funding() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    binance = BinanceClient()
-    hl = HyperliquidClient()
-    dv = DerivClient()
+async def _fetch_all(
+    binance: BinanceClient,
+    hl: HyperliquidClient,
+    dv: DerivClient,
+    start: datetime,
+    end: datetime,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    df_bin, df_hl, df_dv = await asyncio.gather(
+        binance.get_funding_history_async("BTCUSDT", start, end),
+        hl.get_funding_history_async("BTC", start, end),
+        dv.get_funding_history_async("BTC-PERP", start, end),
+    )
+
+    return df_bin, df_hl, df_dv
 
+
+def fetch_funding() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     now = datetime.now(timezone.utc)
     start = now - timedelta(hours=8)
 
-    df_bin = binance.get_funding_history("BTCUSDT", start, now)
-    df_hl = hl.get_funding_history("BTC", start, now)
-    df_dv = dv.get_funding_history("BTC-PERP", start, now)
+    # Resolve cached resources here, on the script thread; the loop thread
+    # has no ScriptRunContext.
+    runtime, binance, hl, dv = _clients()
+    return runtime.run(_fetch_all(binance, hl, dv, start, now))
 
-    return df_bin, df_hl, df_dv
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_funding_cached(
+    bucket: int,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, datetime]:
+    """
+    Cached wrapper around fetch_funding.
+
+    `bucket` is only part of the cache key: callers pass
+    int(time.time() // refresh_interval) so the entry rolls over once per
+    refresh interval. The fetch timestamp is returned alongside the frames.
+    """
+    df_bin, df_hl, df_dv = fetch_funding()
+    return df_bin, df_hl, df_dv, datetime.now(timezone.utc)
 
 
 def compute_best(
@@ -173,21 +266,27 @@ def compute_best(
     df_hl: pd.DataFrame,
     df_dv: pd.DataFrame,
 ):
-    latest: dict[str, float] = {}
-
-    if not df_bin.empty:
-        latest["Binance"] = float(df_bin["funding_rate"].iloc[-1])
-    if not df_hl.empty:
-        latest["Hyperliquid"] = float(df_hl["funding_rate"].iloc[-1])
-    if not df_dv.empty:
-        latest["Deriv"] = float(df_dv["funding_rate"].iloc[-1])
-
-    if not latest:
-        return None, None, 0.0, 0.0, latest
+    venues = [
+        (name, df)
+        for name, df in (("Binance", df_bin), ("Hyperliquid", df_hl), ("Deriv", df_dv))
+        if not df.empty
+    ]
+    if not venues:
+        return None, None, 0.0, 0.0, {}
+
+    names = [name for name, _ in venues]
+    rates = np.fromiter(
+        (df["funding_rate"].iat[-1] for _, df in venues),
+        dtype=np.float64,
+        count=len(venues),
+    )
+    latest: dict[str, float] = dict(zip(names, rates.tolist()))
 
-    ranked = sorted(latest.items(), key=lambda x: x[1], reverse=True)
-    long_ex, long_rate = ranked[0]
-    short_ex, short_rate = ranked[-1]
+    # Ties resolve as the old stable descending sort did: first max, last min.
+    i_hi = int(rates.argmax())
+    i_lo = len(rates) - 1 - int(rates[::-1].argmin())
+    long_ex, long_rate = names[i_hi], float(rates[i_hi])
+    short_ex, short_rate = names[i_lo], float(rates[i_lo])
 
     spread = long_rate - short_rate
     apy = spread * 3.0 * 365.0 * 100.0
@@ -210,9 +309,10 @@ def compute_opportunity_stats(
             tcol = "funding_time"
         else:
             return None
-        s = df[[tcol, "funding_rate"]].copy()
-        s[tcol] = pd.to_datetime(s[tcol], utc=True)
-        s = s.set_index(tcol).sort_index()["funding_rate"]
+        s = pd.Series(
+            df["funding_rate"].to_numpy(),
+            index=pd.DatetimeIndex(pd.to_datetime(df[tcol], utc=True)),
+        ).sort_index()
         return s
 
     s_bin = make_series(df_bin)
@@ -230,20 +330,57 @@ def compute_opportunity_stats(
     if len(series_dict) < 2:
         return 0, 0.0, 0.0
 
-    merged = pd.concat(series_dict.values(), axis=1, join="inner")
-    if merged.empty:
+    # Venues fund on different schedules, so exact timestamps rarely line up.
+    # Align every venue onto the densest series by nearest timestamp instead.
+    frames = sorted(
+        (s.rename(name).to_frame() for name, s in series_dict.items()),
+        key=len,
+        reverse=True,
+    )
+    merged = frames[0]
+    for other in frames[1:]:
+        merged = pd.merge_asof(
+            merged,
+            other,
+            left_index=True,
+            right_index=True,
+            direction="nearest",
+            tolerance=pd.Timedelta("1h"),
+        )
+
+    arr = merged.to_numpy(dtype=np.float64)
+    arr = arr[~np.isnan(arr).any(axis=1)]
+    if arr.size == 0:
         return 0, 0.0, 0.0
 
-    spreads = merged.max(axis=1) - merged.min(axis=1)
-    spreads_pct = spreads * 100.0
+    spreads_pct = np.ptp(arr, axis=1) * 100.0
 
-    opportunities_found = int((spreads_pct >= min_spread_pct).sum())
+    opportunities_found = int(np.count_nonzero(spreads_pct >= min_spread_pct))
     avg_spread_pct = float(spreads_pct.mean())
     max_spread_pct = float(spreads_pct.max())
 
     return opportunities_found, avg_spread_pct, max_spread_pct
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def render_metrics_html(
+    opportunities_found: int,
+    avg_spread_pct: float,
+    max_spread_pct: float,
+    min_spread_pct: float,
+    ts_str: str,
+) -> str:
+    return _METRICS_TMPL.format_map(
+        {
+            "opportunities_found": opportunities_found,
+            "avg_spread_pct": avg_spread_pct,
+            "max_spread_pct": max_spread_pct,
+            "min_spread_pct": min_spread_pct,
+            "ts_str": ts_str,
+        }
+    )
+
+
 def main() -> None:
     st.set_page_config(
         page_title="Funding Rate Arbitrage Monitor",
@@ -252,26 +389,8 @@ def main() -> None:
 
     inject_css()
 
-    st.markdown(
-        """
-        <header>
-            <h1>Funding Rate Arbitrage Monitor</h1>
-            <p class="header-subtitle">
-                Real-time funding rate comparison between Binance, Hyperliquid and Deriv perpetuals
-            </p>
-        </header>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
-        """
-        <div class="alert-info">
-            Info: This dashboard shows live BTC funding rates and the best long/short combo across Binance, Hyperliquid and Deriv.
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+    st.markdown(_ALERT_HTML, unsafe_allow_html=True)
 
     # ---------- controls ----------
     st.markdown('<div class="controls-row">', unsafe_allow_html=True)
@@ -317,12 +436,11 @@ def main() -> None:
     # )
 
     # ---------- data ----------
-    if refresh_clicked or "data_cache" not in st.session_state:
-        df_bin, df_hl, df_dv = fetch_funding()
-        st.session_state["data_cache"] = (df_bin, df_hl, df_dv)
-        st.session_state["last_updated"] = datetime.now(timezone.utc)
-    else:
-        df_bin, df_hl, df_dv = st.session_state["data_cache"]
+    if refresh_clicked:
+        fetch_funding_cached.clear()
+
+    bucket = int(time.time() // int(refresh_interval))
+    df_bin, df_hl, df_dv, last_updated = fetch_funding_cached(bucket)
 
     if export_clicked:
         out = []
@@ -339,13 +457,27 @@ def main() -> None:
                 tcol = "funding_time"
             else:
                 continue
-            tmp = df[[tcol, "funding_rate"]].copy()
-            tmp.rename(columns={tcol: "time"}, inplace=True)
-            tmp["venue"] = venue
-            out.append(tmp)
+            out.append(
+                pd.DataFrame(
+                    {
+                        "time": df[tcol].array,
+                        "funding_rate": df["funding_rate"].to_numpy(),
+                        "venue": venue,
+                    }
+                )
+            )
         if out:
             all_df = pd.concat(out, ignore_index=True)
-            csv = all_df.to_csv(index=False).encode("utf-8")
+            buf = io.BytesIO()
+            # pyarrow always quotes the header it writes, so write a bare one
+            # and leave the rows unquoted; none of these values contain commas.
+            buf.write((",".join(all_df.columns) + "\n").encode())
+            pacsv.write_csv(
+                pa.Table.from_pandas(all_df, preserve_index=False),
+                buf,
+                write_options=_CSV_WRITE_OPTIONS,
+            )
+            csv = buf.getvalue()
             st.download_button(
                 "Download CSV",
                 data=csv,
@@ -358,8 +490,7 @@ def main() -> None:
         df_bin, df_hl, df_dv, min_spread_pct
     )
 
-    ts = st.session_state.get("last_updated", datetime.now(timezone.utc))
-    ts_str = ts.strftime("%Y-%m-%d %H:%M:%S UTC")
+    ts_str = last_updated.strftime("%Y-%m-%d %H:%M:%S UTC")
 
     spread_pct = spread * 100.0
     spread_str = f"{spread_pct:.4f}%"
@@ -369,33 +500,12 @@ def main() -> None:
     best_short = short_ex or "N/A"
 
     # ---------- metrics ----------
-    metrics_html = f"""
-    <div class="metrics-grid">
-      <div class="metric-card">
-        <div class="metric-label">Opportunities Found</div>
-        <div class="metric-value">{opportunities_found}</div>
-        <div class="metric-sublabel">
-            Spread greater or equal to {min_spread_pct:.2f}% (all timestamps)
-        </div>
-      </div>
-      <div class="metric-card">
-        <div class="metric-label">Avg Spread</div>
-        <div class="metric-value metric-positive">{avg_spread_pct:.4f}%</div>
-        <div class="metric-sublabel">Average spread over lookback window</div>
-      </div>
-      <div class="metric-card">
-        <div class="metric-label">Max Spread</div>
-        <div class="metric-value metric-positive">{max_spread_pct:.4f}%</div>
-        <div class="metric-sublabel">Maximum observed spread</div>
-      </div>
-      <div class="metric-card">
-        <div class="metric-label">Last Updated</div>
-        <div class="metric-value">{ts_str}</div>
-        <div class="metric-sublabel">UTC time of last data fetch</div>
-      </div>
-    </div>
-    """
-    st.markdown(metrics_html, unsafe_allow_html=True)
+    st.markdown(
+        render_metrics_html(
+            opportunities_found, avg_spread_pct, max_spread_pct, min_spread_pct, ts_str
+        ),
+        unsafe_allow_html=True,
+    )
 
     # ---------- table ----------
     st.markdown(
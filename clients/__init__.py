@@ -1,3 +1,4 @@
+from ._http import AsyncRuntime
 from .binance import BinanceClient
 from .derive import DerivClient
 from .hyperliquid import HyperliquidClient
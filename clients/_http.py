@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import weakref
+from functools import cache
+from typing import Any, Coroutine, TypeVar
+
+import httpx
+
+
+DEFAULT_TIMEOUT = 5.0
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+
+# Retries failed connection attempts (with backoff); HTTP errors still raise.
+_CONNECT_RETRIES = 3
+
+T = TypeVar("T")
+
+
+@cache
+def shared_client() -> httpx.Client:
+    """
+    Process-wide HTTP/2 client shared by all venue clients.
+
+    Venue clients send absolute URLs, so no base_url is set here.
+    httpx advertises gzip/deflate, plus br when brotli is installed, and
+    decodes responses transparently.
+    """
+    transport = httpx.HTTPTransport(
+        http2=True, limits=_LIMITS, retries=_CONNECT_RETRIES
+    )
+    return httpx.Client(transport=transport, timeout=DEFAULT_TIMEOUT)
+
+
+def new_async_client() -> httpx.AsyncClient:
+    """
+    Async counterpart of shared_client.
+
+    Not shared process-wide: its pooled connections belong to the event loop
+    that first uses it, so each loop needs a client of its own. AsyncRuntime
+    pairs the two.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True, limits=_LIMITS, retries=_CONNECT_RETRIES
+    )
+    return httpx.AsyncClient(transport=transport, timeout=DEFAULT_TIMEOUT)
+
+
+async def _aclose_and_stop(
+    client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop
+) -> None:
+    try:
+        await client.aclose()
+    finally:
+        loop.stop()
+
+
+def _shutdown(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(_aclose_and_stop(client, loop), loop)
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+class AsyncRuntime:
+    """
+    A background event loop together with the AsyncClient bound to it.
+
+    Hold one in a cache (e.g. st.cache_resource) and pass `client` to the
+    venue clients. Once the runtime is dropped, the client is closed and the
+    loop thread exits, so clearing the cache never strands a client on a
+    dead loop.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.client = new_async_client()
+        threading.Thread(target=_run_loop, args=(self.loop,), daemon=True).start()
+        weakref.finalize(self, _shutdown, self.client, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run coro on the background loop and block until it finishes.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
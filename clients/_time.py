@@ -0,0 +1,16 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+@lru_cache(maxsize=64)
+def to_millis(dt: datetime) -> int:
+    """
+    Milliseconds since the Unix epoch. Naive datetimes are treated as UTC.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MS
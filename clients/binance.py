@@ -1,29 +1,45 @@
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime
 
 import httpx
+import orjson
+import numpy as np
 import pandas as pd
 
+from ._http import DEFAULT_TIMEOUT, new_async_client, shared_client
+from ._time import to_millis
+
 
 class BinanceFuturesFundingClient:
     DEFAULT_BASE_URL = "https://fapi.binance.com"
+    FUNDING_RATE_ENDPOINT = "/fapi/v1/fundingRate"
 
     def __init__(
         self,
         base_url: Optional[str] = None,
-        timeout: float = 5.0,
+        timeout: float = DEFAULT_TIMEOUT,
         client: Optional[httpx.Client] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.timeout = timeout
 
-        if client is not None:
-            self.client = client
-        else:
-            self.client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        self.client = client if client is not None else shared_client()
+        # An injected AsyncClient belongs to the caller (usually an
+        # AsyncRuntime); only a client created here is closed by aclose.
+        self._owns_async_client = async_client is None
+        self.async_client = (
+            async_client if async_client is not None else new_async_client()
+        )
 
     def close(self) -> None:
-        self.client.close()
+        # The shared pool outlives any single venue client.
+        if self.client is not shared_client():
+            self.client.close()
+
+    async def aclose(self) -> None:
+        if self._owns_async_client:
+            await self.async_client.aclose()
 
     def get_funding_rate_history(
         self,
@@ -32,6 +48,95 @@ class BinanceFuturesFundingClient:
         end_time_ms: Optional[int] = None,
         limit: int = 1000,
     ) -> pd.DataFrame:
+        self._validate_range(start_time_ms, end_time_ms, limit)
+        params = self._build_params(symbol, end_time_ms, limit)
+
+        if start_time_ms is None and end_time_ms is None:
+            return self._build_frame(self._request(self.FUNDING_RATE_ENDPOINT, params))
+
+        rows: List[Dict[str, Any]] = []
+        current_start = start_time_ms
+        while True:
+            if current_start is not None:
+                params["startTime"] = current_start
+
+            batch = self._request(self.FUNDING_RATE_ENDPOINT, params)
+            rows.extend(batch)
+
+            current_start = self._next_start(batch, limit, end_time_ms)
+            if current_start is None:
+                break
+
+        return self._build_frame(rows)
+
+    async def get_funding_rate_history_async(
+        self,
+        symbol: str,
+        start_time_ms: Optional[int] = None,
+        end_time_ms: Optional[int] = None,
+        limit: int = 1000,
+    ) -> pd.DataFrame:
+        self._validate_range(start_time_ms, end_time_ms, limit)
+        params = self._build_params(symbol, end_time_ms, limit)
+
+        if start_time_ms is None and end_time_ms is None:
+            data = await self._request_async(self.FUNDING_RATE_ENDPOINT, params)
+            return self._build_frame(data)
+
+        rows: List[Dict[str, Any]] = []
+        current_start = start_time_ms
+        while True:
+            if current_start is not None:
+                params["startTime"] = current_start
+
+            batch = await self._request_async(self.FUNDING_RATE_ENDPOINT, params)
+            rows.extend(batch)
+
+            current_start = self._next_start(batch, limit, end_time_ms)
+            if current_start is None:
+                break
+
+        return self._build_frame(rows)
+
+    @staticmethod
+    def _build_params(
+        symbol: str,
+        end_time_ms: Optional[int],
+        limit: int,
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
+            "symbol": symbol,
+            "limit": limit,
+        }
+        if end_time_ms is not None:
+            params["endTime"] = end_time_ms
+        return params
+
+    @staticmethod
+    def _next_start(
+        batch: List[Dict[str, Any]],
+        limit: int,
+        end_time_ms: Optional[int],
+    ) -> Optional[int]:
+        """
+        startTime of the page after batch, or None when batch was the last.
+        """
+        # Only a full page can have more rows behind it.
+        if len(batch) < limit:
+            return None
+
+        # Batches come back sorted by ascending fundingTime.
+        next_start = int(batch[-1]["fundingTime"]) + 1
+        if end_time_ms is not None and next_start > end_time_ms:
+            return None
+        return next_start
+
+    @staticmethod
+    def _validate_range(
+        start_time_ms: Optional[int],
+        end_time_ms: Optional[int],
+        limit: int,
+    ) -> None:
         if limit < 1 or limit > 1000:
             raise ValueError("limit must be between 1 and 1000")
 
@@ -42,42 +147,8 @@ class BinanceFuturesFundingClient:
         ):
             raise ValueError("start_time_ms must be <= end_time_ms")
 
-        endpoint = "/fapi/v1/fundingRate"
-        base_params: Dict[str, Any] = {
-            "symbol": symbol,
-            "limit": limit,
-        }
-
-        rows: List[Dict[str, Any]] = []
-
-        if start_time_ms is None and end_time_ms is None:
-            params = dict(base_params)
-            data = self._request(endpoint, params)
-            rows.extend(data)
-        else:
-            current_start = start_time_ms
-            while True:
-                params = dict(base_params)
-                if current_start is not None:
-                    params["startTime"] = current_start
-                if end_time_ms is not None:
-                    params["endTime"] = end_time_ms
-
-                batch = self._request(endpoint, params)
-                if not batch:
-                    break
-
-                rows.extend(batch)
-
-                if len(batch) < limit:
-                    break
-
-                last_time = max(int(item["fundingTime"]) for item in batch)
-                next_start = last_time + 1
-                if end_time_ms is not None and next_start > end_time_ms:
-                    break
-                current_start = next_start
-
+    @staticmethod
+    def _build_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
         if not rows:
             return pd.DataFrame(
                 columns=[
@@ -89,35 +160,54 @@ class BinanceFuturesFundingClient:
                 ]
             )
 
-        df = pd.DataFrame(rows)
-
-        df["funding_time"] = pd.to_datetime(df["fundingTime"], unit="ms", utc=True)
-        df["funding_rate"] = df["fundingRate"].astype(float)
-
-        if "markPrice" in df.columns:
-            df["mark_price"] = df["markPrice"].astype(float)
-        else:
-            df["mark_price"] = pd.NA
-
-        df["funding_rate_bps"] = df["funding_rate"] * 10000.0
-
-        df = df[
-            [
-                "symbol",
-                "funding_time",
-                "funding_rate",
-                "funding_rate_bps",
-                "mark_price",
-            ]
-        ].sort_values("funding_time")
+        n = len(rows)
+        funding_time_ms = np.fromiter(
+            (int(r["fundingTime"]) for r in rows), dtype=np.int64, count=n
+        )
+        # Rows usually arrive in ascending time; only reorder when they do not.
+        if not (np.diff(funding_time_ms) >= 0).all():
+            order = np.argsort(funding_time_ms, kind="stable")
+            rows = [rows[i] for i in order]
+            funding_time_ms = funding_time_ms[order]
+        funding_rate = np.fromiter(
+            (float(r["fundingRate"]) for r in rows), dtype=np.float64, count=n
+        )
+        # Older rows may carry an empty or missing markPrice.
+        mark_price = np.fromiter(
+            (float(r.get("markPrice") or "nan") for r in rows),
+            dtype=np.float64,
+            count=n,
+        )
 
-        df.reset_index(drop=True, inplace=True)
+        df = pd.DataFrame(
+            {
+                "symbol": [r["symbol"] for r in rows],
+                "funding_time": pd.to_datetime(funding_time_ms, unit="ms", utc=True),
+                "funding_rate": funding_rate,
+                "funding_rate_bps": funding_rate * 10000.0,
+                "mark_price": mark_price,
+            }
+        ).astype({"symbol": "string[pyarrow]"})
         return df
 
     def _request(self, endpoint: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        resp = self.client.get(endpoint, params=params)
+        resp = self.client.get(
+            self.base_url + endpoint, params=params, timeout=self.timeout
+        )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
+        if not isinstance(data, list):
+            raise RuntimeError("Unexpected response format from Binance")
+        return data
+
+    async def _request_async(
+        self, endpoint: str, params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        resp = await self.async_client.get(
+            self.base_url + endpoint, params=params, timeout=self.timeout
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
         if not isinstance(data, list):
             raise RuntimeError("Unexpected response format from Binance")
         return data
@@ -128,14 +218,9 @@ class BinanceClient(BinanceFuturesFundingClient):
     Thin adapter to match the dashboard API:
 
     get_funding_history(symbol: str, start_time: datetime, end_time: Optional[datetime])
+    get_funding_history_async(...)  # same arguments, awaitable
     """
 
-    @staticmethod
-    def _to_millis(dt: datetime) -> int:
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return int(dt.timestamp() * 1000)
-
     def get_funding_history(
         self,
         symbol: str,
@@ -143,8 +228,8 @@ class BinanceClient(BinanceFuturesFundingClient):
         end_time: Optional[datetime] = None,
         limit: int = 1000,
     ) -> pd.DataFrame:
-        start_ms = self._to_millis(start_time)
-        end_ms = self._to_millis(end_time) if end_time is not None else None
+        start_ms = to_millis(start_time)
+        end_ms = to_millis(end_time) if end_time is not None else None
 
         return super().get_funding_rate_history(
             symbol=symbol,
@@ -152,3 +237,20 @@ class BinanceClient(BinanceFuturesFundingClient):
             end_time_ms=end_ms,
             limit=limit,
         )
+
+    async def get_funding_history_async(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> pd.DataFrame:
+        start_ms = to_millis(start_time)
+        end_ms = to_millis(end_time) if end_time is not None else None
+
+        return await super().get_funding_rate_history_async(
+            symbol=symbol,
+            start_time_ms=start_ms,
+            end_time_ms=end_ms,
+            limit=limit,
+        )
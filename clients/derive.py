@@ -1,10 +1,15 @@
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
 
 import time
 import httpx
+import orjson
+import numpy as np
 import pandas as pd
 
+from ._http import DEFAULT_TIMEOUT, new_async_client, shared_client
+from ._time import to_millis
+
 
 class DeriveFundingClient:
     """
@@ -17,23 +22,29 @@ class DeriveFundingClient:
     def __init__(
         self,
         base_url: Optional[str] = None,
-        timeout: float = 5.0,
+        timeout: float = DEFAULT_TIMEOUT,
         client: Optional[httpx.Client] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.timeout = timeout
 
-        if client is not None:
-            self.client = client
-        else:
-            self.client = httpx.Client(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                headers={"Content-Type": "application/json"},
-            )
+        self.client = client if client is not None else shared_client()
+        # An injected AsyncClient belongs to the caller (usually an
+        # AsyncRuntime); only a client created here is closed by aclose.
+        self._owns_async_client = async_client is None
+        self.async_client = (
+            async_client if async_client is not None else new_async_client()
+        )
 
     def close(self) -> None:
-        self.client.close()
+        # The shared pool outlives any single venue client.
+        if self.client is not shared_client():
+            self.client.close()
+
+    async def aclose(self) -> None:
+        if self._owns_async_client:
+            await self.async_client.aclose()
 
     def get_funding_rate_history(
         self,
@@ -59,6 +70,35 @@ class DeriveFundingClient:
             "900", "3600", "14400", "28800", "86400".
             By default we do not send this field.
         """
+        payload, period_value = self._build_payload(
+            instrument_name, start_timestamp_ms, end_timestamp_ms, period
+        )
+        data = self._post("/public/get_funding_rate_history", payload)
+        return self._build_frame(data, instrument_name, period_value)
+
+    async def get_funding_rate_history_async(
+        self,
+        instrument_name: str,
+        start_timestamp_ms: Optional[int] = None,
+        end_timestamp_ms: Optional[int] = None,
+        period: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Async variant of get_funding_rate_history, same parameters.
+        """
+        payload, period_value = self._build_payload(
+            instrument_name, start_timestamp_ms, end_timestamp_ms, period
+        )
+        data = await self._post_async("/public/get_funding_rate_history", payload)
+        return self._build_frame(data, instrument_name, period_value)
+
+    @staticmethod
+    def _build_payload(
+        instrument_name: str,
+        start_timestamp_ms: Optional[int],
+        end_timestamp_ms: Optional[int],
+        period: Optional[str],
+    ) -> Tuple[Dict[str, Any], Optional[int]]:
         if end_timestamp_ms is None:
             end_timestamp_ms = int(time.time() * 1000)
 
@@ -85,8 +125,14 @@ class DeriveFundingClient:
             except (TypeError, ValueError):
                 period_value = None
 
-        data = self._post("/public/get_funding_rate_history", payload)
+        return payload, period_value
 
+    @staticmethod
+    def _build_frame(
+        data: Any,
+        instrument_name: str,
+        period_value: Optional[int],
+    ) -> pd.DataFrame:
         result = data.get("result") if isinstance(data, dict) else None
         history: Optional[List[Dict[str, Any]]] = None
         if isinstance(result, dict):
@@ -103,31 +149,43 @@ class DeriveFundingClient:
                 ]
             )
 
-        df = pd.DataFrame(history)
-
-        df["time"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-        df["funding_rate"] = df["funding_rate"].astype(float)
-        df["funding_rate_bps"] = df["funding_rate"] * 10000.0
-        df["instrument_name"] = instrument_name
-        df["period_sec"] = period_value
-
-        df = df[
-            [
-                "instrument_name",
-                "time",
-                "funding_rate",
-                "funding_rate_bps",
-                "period_sec",
-            ]
-        ].sort_values("time")
-
-        df.reset_index(drop=True, inplace=True)
+        n = len(history)
+        timestamp_ms = np.fromiter(
+            (int(h["timestamp"]) for h in history), dtype=np.int64, count=n
+        )
+        # Rows usually arrive in ascending time; only reorder when they do not.
+        if not (np.diff(timestamp_ms) >= 0).all():
+            order = np.argsort(timestamp_ms, kind="stable")
+            history = [history[i] for i in order]
+            timestamp_ms = timestamp_ms[order]
+        funding_rate = np.fromiter(
+            (float(h["funding_rate"]) for h in history), dtype=np.float64, count=n
+        )
+
+        df = pd.DataFrame(
+            {
+                "instrument_name": instrument_name,
+                "time": pd.to_datetime(timestamp_ms, unit="ms", utc=True),
+                "funding_rate": funding_rate,
+                "funding_rate_bps": funding_rate * 10000.0,
+                "period_sec": period_value,
+            }
+        ).astype({"instrument_name": "string[pyarrow]"})
         return df
 
     def _post(self, endpoint: str, payload: Dict[str, Any]) -> Any:
-        resp = self.client.post(endpoint, json=payload)
+        resp = self.client.post(
+            self.base_url + endpoint, json=payload, timeout=self.timeout
+        )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
+
+    async def _post_async(self, endpoint: str, payload: Dict[str, Any]) -> Any:
+        resp = await self.async_client.post(
+            self.base_url + endpoint, json=payload, timeout=self.timeout
+        )
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
 
 class DerivClient(DeriveFundingClient):
@@ -140,14 +198,9 @@ class DerivClient(DeriveFundingClient):
         end_time: Optional[datetime],
         period: Optional[str] = None,
     )
+    get_funding_history_async(...)  # same arguments, awaitable
     """
 
-    @staticmethod
-    def _to_millis(dt: datetime) -> int:
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return int(dt.timestamp() * 1000)
-
     def get_funding_history(
         self,
         instrument_name: str,
@@ -155,8 +208,8 @@ class DerivClient(DeriveFundingClient):
         end_time: Optional[datetime] = None,
         period: Optional[str] = None,
     ) -> pd.DataFrame:
-        start_ms = self._to_millis(start_time)
-        end_ms = self._to_millis(end_time) if end_time is not None else None
+        start_ms = to_millis(start_time)
+        end_ms = to_millis(end_time) if end_time is not None else None
 
         return super().get_funding_rate_history(
             instrument_name=instrument_name,
@@ -164,3 +217,20 @@ class DerivClient(DeriveFundingClient):
             end_timestamp_ms=end_ms,
             period=period,
         )
+
+    async def get_funding_history_async(
+        self,
+        instrument_name: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        period: Optional[str] = None,
+    ) -> pd.DataFrame:
+        start_ms = to_millis(start_time)
+        end_ms = to_millis(end_time) if end_time is not None else None
+
+        return await super().get_funding_rate_history_async(
+            instrument_name=instrument_name,
+            start_timestamp_ms=start_ms,
+            end_timestamp_ms=end_ms,
+            period=period,
+        )
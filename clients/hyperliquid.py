@@ -1,9 +1,19 @@
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime
+from operator import itemgetter
 
 import httpx
+import orjson
+import numpy as np
 import pandas as pd
 
+from ._http import DEFAULT_TIMEOUT, new_async_client, shared_client
+from ._time import to_millis
+
+
+_get_funding_rate = itemgetter("fundingRate")
+_get_next_funding_time = itemgetter("nextFundingTime")
+
 
 class HyperliquidInfoClient:
     """
@@ -16,23 +26,29 @@ class HyperliquidInfoClient:
     def __init__(
         self,
         base_url: Optional[str] = None,
-        timeout: float = 5.0,
+        timeout: float = DEFAULT_TIMEOUT,
         client: Optional[httpx.Client] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.timeout = timeout
 
-        if client is not None:
-            self.client = client
-        else:
-            self.client = httpx.Client(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                headers={"Content-Type": "application/json"},
-            )
+        self.client = client if client is not None else shared_client()
+        # An injected AsyncClient belongs to the caller (usually an
+        # AsyncRuntime); only a client created here is closed by aclose.
+        self._owns_async_client = async_client is None
+        self.async_client = (
+            async_client if async_client is not None else new_async_client()
+        )
 
     def close(self) -> None:
-        self.client.close()
+        # The shared pool outlives any single venue client.
+        if self.client is not shared_client():
+            self.client.close()
+
+    async def aclose(self) -> None:
+        if self._owns_async_client:
+            await self.async_client.aclose()
 
     def get_predicted_funding(self) -> pd.DataFrame:
         """
@@ -51,51 +67,38 @@ class HyperliquidInfoClient:
         payload: Dict[str, Any] = {"type": "predictedFundings"}
         data = self._post("/info", payload)
 
-        rows: List[Dict[str, Any]] = []
+        assets: List[Any] = []
+        venue_names: List[Any] = []
+        rates: List[Any] = []
+        next_times: List[Any] = []
 
         for entry in data:
-            if not isinstance(entry, list) or len(entry) != 2:
+            try:
+                asset, venues = entry
+            except (TypeError, ValueError):
                 continue
 
-            asset = entry[0]
-            venues = entry[1]
-
             for venue_entry in venues:
-                if (
-                    not isinstance(venue_entry, list)
-                    or len(venue_entry) != 2
-                    or not isinstance(venue_entry[1], dict)
-                ):
+                try:
+                    venue_name, details = venue_entry
+                    rate = _get_funding_rate(details)
+                    next_ms = _get_next_funding_time(details)
+                except (KeyError, TypeError, ValueError):
                     continue
 
-                venue_name = venue_entry[0]
-                details = venue_entry[1]
-
-                funding_rate_str = details.get("fundingRate")
-                next_funding_time_ms = details.get("nextFundingTime")
-
-                if funding_rate_str is None or next_funding_time_ms is None:
-                    continue
+                assets.append(asset)
+                venue_names.append(venue_name)
+                rates.append(rate)
+                next_times.append(next_ms)
 
-                try:
-                    funding_rate = float(funding_rate_str)
-                    next_time = pd.to_datetime(
-                        int(next_funding_time_ms), unit="ms", utc=True
-                    )
-                except (ValueError, TypeError):
-                    continue
+        # Cast in bulk; null or unparseable entries become NaN and are dropped.
+        funding_rate = pd.to_numeric(pd.Series(rates, dtype=object), errors="coerce")
+        next_time_ms = pd.to_numeric(
+            pd.Series(next_times, dtype=object), errors="coerce"
+        )
+        valid = (funding_rate.notna() & next_time_ms.notna()).to_numpy()
 
-                rows.append(
-                    {
-                        "asset": asset,
-                        "venue": venue_name,
-                        "funding_rate": funding_rate,
-                        "funding_rate_bps": funding_rate * 10000.0,
-                        "next_funding_time": next_time,
-                    }
-                )
-
-        if not rows:
+        if not valid.any():
             return pd.DataFrame(
                 columns=[
                     "asset",
@@ -106,7 +109,21 @@ class HyperliquidInfoClient:
                 ]
             )
 
-        df = pd.DataFrame(rows)
+        rates_np = funding_rate.to_numpy(dtype=np.float64)[valid]
+        df = pd.DataFrame(
+            {
+                "asset": np.asarray(assets, dtype=object)[valid],
+                "venue": np.asarray(venue_names, dtype=object)[valid],
+                "funding_rate": rates_np,
+                "funding_rate_bps": rates_np * 10000.0,
+                "next_funding_time": pd.to_datetime(
+                    next_time_ms.to_numpy()[valid].astype(np.int64),
+                    unit="ms",
+                    utc=True,
+                ),
+            }
+        )
+        df = df.astype({"asset": "string[pyarrow]", "venue": "string[pyarrow]"})
         df = df.sort_values(["asset", "venue"]).reset_index(drop=True)
         return df
 
@@ -137,6 +154,29 @@ class HyperliquidInfoClient:
             - premium
             - premium_bps
         """
+        payload = self._history_payload(coin, start_time_ms, end_time_ms)
+        data = self._post("/info", payload)
+        return self._build_history_frame(data)
+
+    async def get_funding_history_async(
+        self,
+        coin: str,
+        start_time_ms: int,
+        end_time_ms: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Async variant of get_funding_history, same parameters and columns.
+        """
+        payload = self._history_payload(coin, start_time_ms, end_time_ms)
+        data = await self._post_async("/info", payload)
+        return self._build_history_frame(data)
+
+    @staticmethod
+    def _history_payload(
+        coin: str,
+        start_time_ms: int,
+        end_time_ms: Optional[int],
+    ) -> Dict[str, Any]:
         if start_time_ms < 0:
             raise ValueError("start_time_ms must be non-negative")
 
@@ -151,8 +191,10 @@ class HyperliquidInfoClient:
         if end_time_ms is not None:
             payload["endTime"] = int(end_time_ms)
 
-        data = self._post("/info", payload)
+        return payload
 
+    @staticmethod
+    def _build_history_frame(data: Any) -> pd.DataFrame:
         if not isinstance(data, list) or not data:
             return pd.DataFrame(
                 columns=[
@@ -165,33 +207,45 @@ class HyperliquidInfoClient:
                 ]
             )
 
-        df = pd.DataFrame(data)
-
-        df["time"] = pd.to_datetime(df["time"], unit="ms", utc=True)
-        df["funding_rate"] = df["fundingRate"].astype(float)
-        df["premium"] = df["premium"].astype(float)
-
-        df["funding_rate_bps"] = df["funding_rate"] * 10000.0
-        df["premium_bps"] = df["premium"] * 10000.0
-
-        df = df[
-            [
-                "coin",
-                "time",
-                "funding_rate",
-                "funding_rate_bps",
-                "premium",
-                "premium_bps",
-            ]
-        ].sort_values("time")
+        n = len(data)
+        time_ms = np.fromiter((int(d["time"]) for d in data), dtype=np.int64, count=n)
+        # Rows usually arrive in ascending time; only reorder when they do not.
+        if not (np.diff(time_ms) >= 0).all():
+            order = np.argsort(time_ms, kind="stable")
+            data = [data[i] for i in order]
+            time_ms = time_ms[order]
+        funding_rate = np.fromiter(
+            (float(d["fundingRate"]) for d in data), dtype=np.float64, count=n
+        )
+        premium = np.fromiter(
+            (float(d["premium"]) for d in data), dtype=np.float64, count=n
+        )
 
-        df.reset_index(drop=True, inplace=True)
+        df = pd.DataFrame(
+            {
+                "coin": [d["coin"] for d in data],
+                "time": pd.to_datetime(time_ms, unit="ms", utc=True),
+                "funding_rate": funding_rate,
+                "funding_rate_bps": funding_rate * 10000.0,
+                "premium": premium,
+                "premium_bps": premium * 10000.0,
+            }
+        ).astype({"coin": "string[pyarrow]"})
         return df
 
     def _post(self, endpoint: str, payload: Dict[str, Any]) -> Any:
-        resp = self.client.post(endpoint, json=payload)
+        resp = self.client.post(
+            self.base_url + endpoint, json=payload, timeout=self.timeout
+        )
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    async def _post_async(self, endpoint: str, payload: Dict[str, Any]) -> Any:
+        resp = await self.async_client.post(
+            self.base_url + endpoint, json=payload, timeout=self.timeout
+        )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
 
 class HyperliquidClient(HyperliquidInfoClient):
@@ -203,25 +257,35 @@ class HyperliquidClient(HyperliquidInfoClient):
         start_time: datetime,
         end_time: Optional[datetime],
     )
+    get_funding_history_async(...)  # same arguments, awaitable
     """
 
-    @staticmethod
-    def _to_millis(dt: datetime) -> int:
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return int(dt.timestamp() * 1000)
-
     def get_funding_history(
         self,
         coin: str,
         start_time: datetime,
         end_time: Optional[datetime] = None,
     ) -> pd.DataFrame:
-        start_ms = self._to_millis(start_time)
-        end_ms = self._to_millis(end_time) if end_time is not None else None
+        start_ms = to_millis(start_time)
+        end_ms = to_millis(end_time) if end_time is not None else None
 
         return super().get_funding_history(
             coin=coin,
             start_time_ms=start_ms,
             end_time_ms=end_ms,
         )
+
+    async def get_funding_history_async(
+        self,
+        coin: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        start_ms = to_millis(start_time)
+        end_ms = to_millis(end_time) if end_time is not None else None
+
+        return await super().get_funding_history_async(
+            coin=coin,
+            start_time_ms=start_ms,
+            end_time_ms=end_ms,
+        )
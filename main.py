@@ -1,58 +1,316 @@
+import asyncio
+import time
+import uuid
+
+import numpy as np
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 import plotly.graph_objects as go
 
+from clients import AsyncRuntime
 from clients import HyperliquidClient
 from clients import DerivClient
 from clients import BinanceClient
 
-INSTRUMENT_MAPPING = {
-    "BTC": {
-        "hyperliquid": "BTC",
-        "derive": "BTC-PERP",
-        "binance": "BTCUSDT",
-    }
+
+@dataclass(frozen=True, slots=True)
+class VenueSymbols:
+    """
+    Per-venue symbol of one instrument. Fields are named after the
+    VENUE_TIME_COLUMNS keys, so loops over venues can read them by getattr.
+    """
+    hyperliquid: str
+    derive: str
+    binance: str
+
+
+INSTRUMENT_MAPPING: dict[str, VenueSymbols] = {
+    "BTC": VenueSymbols(hyperliquid="BTC", derive="BTC-PERP", binance="BTCUSDT"),
+}
+
+FUNDING_COLUMNS = ("funding_hl", "funding_derive", "funding_binance")
+
+SPREAD_PAIRS = (
+    ("funding_hl", "funding_derive", "spread_hl_derive_bps"),
+    ("funding_hl", "funding_binance", "spread_hl_binance_bps"),
+    ("funding_derive", "funding_binance", "spread_derive_binance_bps"),
+)
+
+EXCHANGE_LABELS = {
+    "funding_hl_bps": "Hyperliquid",
+    "funding_derive_bps": "Deriv",
+    "funding_binance_bps": "Binance",
 }
 
+SPREAD_LABELS = {
+    "spread_hl_derive_bps": "HL - Deriv",
+    "spread_hl_binance_bps": "HL - Binance",
+    "spread_derive_binance_bps": "Deriv - Binance",
+}
+
+# Charts keep full resolution up to LTTB_THRESHOLD points per trace and are
+# downsampled to LTTB_POINTS beyond that; tables keep every row.
+LTTB_THRESHOLD = 1000
+LTTB_POINTS = 500
+
+VENUE_TIME_COLUMNS = {
+    "hyperliquid": "time",
+    "derive": "time",
+    "binance": "funding_time",
+}
+
+# Parquet hands string columns back as string[python]; the clients build
+# these as string[pyarrow], so _read_window restores that dtype.
+VENUE_LABEL_COLUMNS = {
+    "hyperliquid": "coin",
+    "derive": "instrument_name",
+    "binance": "symbol",
+}
+
+# On-disk funding history, one Parquet file per venue, symbol and UTC day.
+CACHE_DIR = Path(__file__).resolve().parent / ".funding_cache"
+CHUNK = timedelta(days=1)
+CHUNK_TTL_S = 60
+
+# Chunk requests in flight at once across all venues; HTTP/2 multiplexes
+# the ones to the same venue host over one connection.
+FETCH_CONCURRENCY = 8
+# Upper bound on waiting for a single venue request, so one hung exchange
+# does not stall the whole page.
+FETCH_TIMEOUT_S = 15.0
+
+# Frames derived from the raw windows are keyed by fingerprint, which moves
+# as the rolling window gains rows; only the latest few are ever read again.
+DERIVED_CACHE_ENTRIES = 16
+
+
+VenueClients = tuple[HyperliquidClient, DerivClient, BinanceClient]
+
+
+@st.cache_resource
+def get_clients() -> tuple[AsyncRuntime, VenueClients]:
+    """
+    Background event loop and the venue clients it drives, shared across
+    reruns and sessions. The venue clients share the runtime's HTTP/2
+    AsyncClient, which is bound to that loop, so all of it lives in one
+    resource and a cache clear replaces it together.
+    """
+    runtime = AsyncRuntime()
+    return runtime, (
+        HyperliquidClient(async_client=runtime.client),
+        DerivClient(async_client=runtime.client),
+        BinanceClient(async_client=runtime.client),
+    )
+
+
+async def _fetch_venue(
+    clients: VenueClients,
+    venue: str,
+    symbol: str,
+    start: datetime,
+    end: datetime,
+) -> pd.DataFrame:
+    hl_client, derive_client, binance_client = clients
+
+    if venue == "hyperliquid":
+        return await hl_client.get_funding_history_async(
+            coin=symbol, start_time=start, end_time=end
+        )
+    if venue == "derive":
+        return await derive_client.get_funding_history_async(
+            instrument_name=symbol, start_time=start, end_time=end
+        )
+    if venue == "binance":
+        return await binance_client.get_funding_history_async(
+            symbol=symbol, start_time=start, end_time=end
+        )
+    raise ValueError(f"Unsupported venue: {venue}")
+
+
+def _chunk_path(venue: str, symbol: str, chunk_start: datetime) -> Path:
+    return CACHE_DIR / venue / symbol / f"{chunk_start:%Y-%m-%d}.parquet"
+
+
+def _chunk_is_fresh(path: Path, chunk_end: datetime, window_start_s: float) -> bool:
+    """
+    A chunk written after its window closed (plus a settle delay) is final.
+    The still-open chunk is only reused while it was written within the
+    current CHUNK_TTL_S window, the same floor the loader cache keys use.
+    """
+    if not path.exists():
+        return False
+    mtime = path.stat().st_mtime
+    if mtime >= chunk_end.timestamp() + CHUNK_TTL_S:
+        return True
+    return mtime >= window_start_s
+
+
+def _write_chunk(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    df.to_parquet(tmp, index=False)
+    tmp.replace(path)
+
+
+async def _fetch_chunk(
+    clients: VenueClients,
+    venue: str,
+    symbol: str,
+    chunk_start: datetime,
+    path: Path,
+    limiter: asyncio.Semaphore,
+) -> None:
+    # Venue end times are inclusive; stop just short of the next chunk.
+    chunk_end = chunk_start + CHUNK - timedelta(milliseconds=1)
+    async with limiter:
+        df = await asyncio.wait_for(
+            _fetch_venue(clients, venue, symbol, chunk_start, chunk_end),
+            timeout=FETCH_TIMEOUT_S,
+        )
+    # Keep disk I/O off the shared event loop.
+    await asyncio.to_thread(_write_chunk, df, path)
+
+
+async def _fetch_chunks(
+    clients: VenueClients,
+    missing: list[tuple[str, str, datetime, Path]],
+) -> None:
+    """
+    Fetch every missing chunk, across all venues, in one gather. A failing
+    venue is only reported once the others' chunks are on disk, so the next
+    rerun refetches just the failed ones.
+    """
+    limiter = asyncio.Semaphore(FETCH_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_fetch_chunk(clients, *m, limiter) for m in missing),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+def _read_window(
+    venue: str,
+    symbol: str,
+    chunk_starts: list[datetime],
+    start: datetime,
+    end: datetime,
+) -> pd.DataFrame:
+    frames = [pd.read_parquet(_chunk_path(venue, symbol, c)) for c in chunk_starts]
+    non_empty = [f for f in frames if not f.empty]
+    if not non_empty:
+        return frames[0]
+
+    df = pd.concat(non_empty, ignore_index=True)
+    label = VENUE_LABEL_COLUMNS[venue]
+    if label in df.columns:
+        df = df.astype({label: "string[pyarrow]"})
+    t = df[VENUE_TIME_COLUMNS[venue]]
+    return df[(t >= start) & (t <= end)].reset_index(drop=True)
+
+
+def _day_chunks(start: datetime, end: datetime) -> list[datetime]:
+    chunk_starts = []
+    c = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while c <= end:
+        chunk_starts.append(c)
+        c += CHUNK
+    return chunk_starts
+
+
+@st.cache_data(ttl=CHUNK_TTL_S, show_spinner=False)
+def _load_hl(symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+    return _read_window("hyperliquid", symbol, _day_chunks(start, end), start, end)
+
+
+@st.cache_data(ttl=CHUNK_TTL_S, show_spinner=False)
+def _load_derive(symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+    return _read_window("derive", symbol, _day_chunks(start, end), start, end)
+
+
+@st.cache_data(ttl=CHUNK_TTL_S, show_spinner=False)
+def _load_binance(symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+    return _read_window("binance", symbol, _day_chunks(start, end), start, end)
+
 
-@st.cache_data(show_spinner=True)
 def load_raw_funding_data(coin: str, days: int = 7):
     """
     Load raw funding data from Hyperliquid, Deriv, and Binance for a given coin.
+
+    History is kept on disk in one Parquet file per venue and UTC day, so
+    only missing or still-open days are fetched from the exchanges. The
+    missing days of every venue are fetched together, then each venue's
+    window is read through its own cache entry, keyed by symbol and window.
     """
-    if coin not in INSTRUMENT_MAPPING:
+    symbols = INSTRUMENT_MAPPING.get(coin)
+    if symbols is None:
         raise ValueError(f"Unsupported coin: {coin}")
 
-    now = datetime.now(timezone.utc)
+    # Floor the window end so reruns within CHUNK_TTL_S share cache keys.
+    now_s = time.time() // CHUNK_TTL_S * CHUNK_TTL_S
+    now = datetime.fromtimestamp(now_s, timezone.utc)
     start = now - timedelta(days=days)
-    mapping = INSTRUMENT_MAPPING[coin]
+    chunk_starts = _day_chunks(start, now)
+
+    # Open chunks are judged against the same floored window as the cache
+    # keys, so this is empty whenever all three cache entries are still valid.
+    missing = []
+    for venue in VENUE_TIME_COLUMNS:
+        symbol = getattr(symbols, venue)
+        for c in chunk_starts:
+            path = _chunk_path(venue, symbol, c)
+            if not _chunk_is_fresh(path, c + CHUNK, now_s):
+                missing.append((venue, symbol, c, path))
+
+    if missing:
+        # Resolved here, on the script thread; the loop thread has no
+        # ScriptRunContext for the resource cache.
+        runtime, clients = get_clients()
+        with st.spinner("Fetching funding history..."):
+            runtime.run(_fetch_chunks(clients, missing))
+
+    df_hl = _load_hl(symbols.hyperliquid, start, now)
+    df_derive = _load_derive(symbols.derive, start, now)
+    df_binance = _load_binance(symbols.binance, start, now)
 
-    hl_client = HyperliquidClient()
-    derive_client = DerivClient()
-    binance_client = BinanceClient()
+    return df_hl, df_derive, df_binance
 
-    df_hl = hl_client.get_funding_history(
-        coin=mapping["hyperliquid"],
-        start_time=start,
-        end_time=now,
-    )
 
-    df_derive = derive_client.get_funding_history(
-        instrument_name=mapping["derive"],
-        start_time=start,
-        end_time=now,
+def _frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Cheap cache key for a funding frame: columns, length and the first and
+    last rows. Published funding rows never change, so this is enough to
+    tell windows apart without hashing every cell.
+    """
+    if df.empty:
+        return tuple(df.columns), 0
+    return (
+        tuple(df.columns),
+        len(df),
+        tuple(df.iloc[0].tolist()),
+        tuple(df.iloc[-1].tolist()),
     )
 
-    df_binance = binance_client.get_funding_history(
-        symbol=mapping["binance"],
-        start_time=start,
-        end_time=now,
-    )
 
-    return df_hl, df_derive, df_binance
+def _ensure_utc(s: pd.Series) -> pd.Series:
+    """
+    s as tz-aware UTC datetimes; returned as-is when it already is.
+    """
+    if s.dtype.kind == "M" and str(getattr(s.dtype, "tz", None)) == "UTC":
+        return s
+    return pd.to_datetime(s, utc=True)
 
 
+@st.cache_data(
+    show_spinner=False,
+    max_entries=DERIVED_CACHE_ENTRIES,
+    hash_funcs={pd.DataFrame: _frame_fingerprint},
+)
 def prepare_merged_timeseries(
     df_hl: pd.DataFrame,
     df_derive: pd.DataFrame,
@@ -63,83 +321,227 @@ def prepare_merged_timeseries(
     Take raw dataframes from each venue and build a unified time series
     with hourly (or other) resampling and spreads in bps.
     """
-    frames = []
-
-    # Hyperliquid
-    if df_hl is not None and not df_hl.empty:
-        hl = df_hl.copy()
-        hl["time"] = pd.to_datetime(hl["time"], utc=True)
-        hl = (
-            hl[["time", "funding_rate"]]
-            .set_index("time")
-            .sort_index()
-            .resample(freq)
-            .mean()
-            .rename(columns={"funding_rate": "funding_hl"})
-        )
-        frames.append(hl)
-
-    # Deriv
-    if df_derive is not None and not df_derive.empty:
-        dv = df_derive.copy()
-        dv["time"] = pd.to_datetime(dv["time"], utc=True)
-        dv = (
-            dv[["time", "funding_rate"]]
-            .set_index("time")
-            .sort_index()
-            .resample(freq)
-            .mean()
-            .rename(columns={"funding_rate": "funding_derive"})
-        )
-        frames.append(dv)
-
-    # Binance
-    if df_binance is not None and not df_binance.empty:
-        bn = df_binance.copy()
-        bn["funding_time"] = pd.to_datetime(bn["funding_time"], utc=True)
-        bn = (
-            bn[["funding_time", "funding_rate"]]
-            .rename(columns={"funding_time": "time"})
-            .set_index("time")
-            .sort_index()
-            .resample(freq)
-            .ffill()
-            .rename(columns={"funding_rate": "funding_binance"})
-        )
-        frames.append(bn)
+    parts = []
+    for df, time_col, venue in (
+        (df_hl, "time", "funding_hl"),
+        (df_derive, "time", "funding_derive"),
+        (df_binance, "funding_time", "funding_binance"),
+    ):
+        if df is not None and not df.empty:
+            # Only the two columns we use; premium, mark price etc. are dropped
+            parts.append(
+                pd.DataFrame(
+                    {
+                        "time": _ensure_utc(df[time_col]).array,
+                        "funding_rate": df["funding_rate"].to_numpy(dtype=np.float32),
+                        "venue": venue,
+                    }
+                )
+            )
 
-    if not frames:
+    if not parts:
         return pd.DataFrame()
 
-    merged = frames[0]
-    for f in frames[1:]:
-        merged = merged.join(f, how="outer")
+    # One long frame and one grouped resample
+    long = pd.concat(parts, ignore_index=True)
+    merged = (
+        long.set_index("time")
+        .groupby("venue")["funding_rate"]
+        .resample(freq)
+        .mean()
+        .unstack("venue")
+        .rename_axis(columns=None)
+    )
+    # One regular, sorted grid spanning every venue
+    full_idx = pd.date_range(
+        merged.index.min(), merged.index.max(), freq=freq, name="time"
+    )
+    merged = merged.reindex(
+        index=full_idx,
+        columns=[c for c in FUNDING_COLUMNS if c in merged.columns],
+    )
 
-    merged = merged.sort_index()
-    merged = merged.reset_index().rename(columns={"index": "time"})
+    # Binance funds every 8h; carry each rate forward until the next one,
+    # but not past its last observation.
+    if "funding_binance" in merged.columns:
+        bn = merged["funding_binance"]
+        last = bn.last_valid_index()
+        merged.loc[:last, "funding_binance"] = bn.loc[:last].ffill()
 
-    # Funding in bps
-    for col in ["funding_hl", "funding_derive", "funding_binance"]:
-        if col in merged.columns:
-            merged[f"{col}_bps"] = merged[col] * 10000.0
+    merged = merged.reset_index()
 
-    # Spreads in bps
-    if {"funding_hl_bps", "funding_derive_bps"}.issubset(merged.columns):
-        merged["spread_hl_derive_bps"] = (
-            merged["funding_hl_bps"] - merged["funding_derive_bps"]
-        )
+    # Funding in bps, converted in one block. float32 is ample for rates
+    # shown to 3 decimals in bps and halves the bytes every later step moves.
+    present = [c for c in FUNDING_COLUMNS if c in merged.columns]
+    vals = merged[present].to_numpy(dtype=np.float32) * np.float32(10000.0)
+    merged[[f"{c}_bps" for c in present]] = vals
 
-    if {"funding_hl_bps", "funding_binance_bps"}.issubset(merged.columns):
-        merged["spread_hl_binance_bps"] = (
-            merged["funding_hl_bps"] - merged["funding_binance_bps"]
-        )
+    # Spreads in bps, taken straight from the converted block
+    pos = {c: i for i, c in enumerate(present)}
+    for left, right, name in SPREAD_PAIRS:
+        if left in pos and right in pos:
+            merged[name] = vals[:, pos[left]] - vals[:, pos[right]]
 
-    if {"funding_derive_bps", "funding_binance_bps"}.issubset(merged.columns):
-        merged["spread_derive_binance_bps"] = (
-            merged["funding_derive_bps"] - merged["funding_binance_bps"]
+    return merged
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=DERIVED_CACHE_ENTRIES,
+    hash_funcs={pd.DataFrame: _frame_fingerprint},
+)
+def _hl_derive_summary(df: pd.DataFrame) -> dict | None:
+    """
+    Overlapping HL/Deriv rows, headline metrics and the top-30 spread table.
+    """
+    pair = df.dropna(subset=["funding_hl_bps", "funding_derive_bps"])
+    if pair.empty:
+        return None
+
+    spread = pair["spread_hl_derive_bps"]
+
+    # Partial sort: only the 30 largest |spread| rows get ordered.
+    abs_spread = np.abs(spread.to_numpy())
+    k = min(30, len(abs_spread))
+    idx = np.argpartition(-abs_spread, k - 1)[:k]
+    idx = idx[np.argsort(-abs_spread[idx], kind="stable")]
+    top = (
+        pair[["time", "funding_hl_bps", "funding_derive_bps", "spread_hl_derive_bps"]]
+        .iloc[idx]
+        .assign(abs_spread=abs_spread[idx])
+        .reset_index(drop=True)
+    )
+
+    top.rename(
+        columns={
+            "time": "Time",
+            "funding_hl_bps": "HL funding (bps)",
+            "funding_derive_bps": "Deriv funding (bps)",
+            "spread_hl_derive_bps": "Spread HL - Deriv (bps)",
+            "abs_spread": "Abs spread (bps)",
+        },
+        inplace=True,
+    )
+
+    return {
+        "pair": pair,
+        "avg_hl": pair["funding_hl_bps"].mean(),
+        "avg_derive": pair["funding_derive_bps"].mean(),
+        "avg_spread": spread.mean(),
+        "max_pos_spread": spread.max(),
+        "positive_share": (spread > 0).mean() * 100.0,
+        "top": top,
+    }
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=DERIVED_CACHE_ENTRIES,
+    hash_funcs={pd.DataFrame: _frame_fingerprint},
+)
+def _all_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-exchange mean and standard deviation of funding (bps).
+    """
+    cols = [c for c in EXCHANGE_LABELS if c in df.columns]
+    stats_df = (
+        df[cols]
+        .agg(["mean", "std"])
+        .T.rename(
+            index=EXCHANGE_LABELS,
+            columns={"mean": "Avg funding (bps)", "std": "Std funding (bps)"},
+        )
+        .rename_axis("Exchange")
+        .reset_index()
+    )
+    return stats_df
+
+
+_LAYOUT_PAIR_FUNDING = go.Layout(
+    title="Funding rates (bps)",
+    xaxis_title="Time",
+    yaxis_title="Funding rate (bps)",
+    hovermode="x unified",
+    template="plotly_white",
+    height=400,
+)
+
+_LAYOUT_PAIR_SPREAD = go.Layout(
+    title="Funding spread HL - Deriv (bps)",
+    xaxis_title="Time",
+    yaxis_title="Spread (bps)",
+    hovermode="x unified",
+    template="plotly_white",
+    height=400,
+)
+
+_LAYOUT_ALL_FUNDING = go.Layout(
+    xaxis_title="Time",
+    yaxis_title="Funding rate (bps)",
+    hovermode="x unified",
+    template="plotly_white",
+    height=450,
+)
+
+_LAYOUT_ALL_SPREADS = go.Layout(
+    xaxis_title="Time",
+    yaxis_title="Spread (bps)",
+    hovermode="x unified",
+    template="plotly_white",
+    height=450,
+)
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of n_out points that preserve
+    the visual shape of the line (x, y). x must be increasing, y NaN-free.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    xf = x.astype(np.float64) - float(x[0])
+    yf = y.astype(np.float64)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xf[hi:nhi].mean()
+        avg_y = yf[hi:nhi].mean()
+        area = np.abs(
+            (xf[a] - avg_x) * (yf[lo:hi] - yf[a])
+            - (xf[a] - xf[lo:hi]) * (avg_y - yf[a])
         )
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
 
-    return merged
+    return idx
+
+
+def _time_values(s: pd.Series) -> np.ndarray:
+    """
+    Time column as a plain datetime64[ns] array (UTC) for plotting.
+    """
+    return s.to_numpy(dtype="datetime64[ns]")
+
+
+def _line_trace(x: np.ndarray, y: np.ndarray, name: str) -> go.Scatter:
+    """
+    Line trace, downsampled with LTTB once it exceeds LTTB_THRESHOLD points.
+    """
+    if len(y) > LTTB_THRESHOLD:
+        mask = ~np.isnan(y)
+        x, y = x[mask], y[mask]
+        keep = _lttb(x.view(np.int64), y, LTTB_POINTS)
+        x, y = x[keep], y[keep]
+    return go.Scatter(x=x, y=y, mode="lines", name=name)
 
 
 def render_hl_derive_tab(df: pd.DataFrame) -> None:
@@ -151,154 +553,69 @@ def render_hl_derive_tab(df: pd.DataFrame) -> None:
         st.warning("Not enough data to compare Hyperliquid and Deriv.")
         return
 
-    pair = df.dropna(subset=["funding_hl_bps", "funding_derive_bps"]).copy()
-    if pair.empty:
+    summary = _hl_derive_summary(df)
+    if summary is None:
         st.warning("No overlapping funding data for Hyperliquid and Deriv.")
         return
 
-    avg_hl = pair["funding_hl_bps"].mean()
-    avg_derive = pair["funding_derive_bps"].mean()
-    avg_spread = pair["spread_hl_derive_bps"].mean()
-    max_pos_spread = pair["spread_hl_derive_bps"].max()
-    max_neg_spread = pair["spread_hl_derive_bps"].min()
-    positive_share = (pair["spread_hl_derive_bps"] > 0).mean() * 100.0
+    pair = summary["pair"]
+    t = _time_values(pair["time"])
 
     col1, col2, col3, col4, col5 = st.columns(5)
 
-    col1.metric("Avg HL funding (bps)", f"{avg_hl:.3f}")
-    col2.metric("Avg Deriv funding (bps)", f"{avg_derive:.3f}")
-    col3.metric("Avg spread HL - Deriv (bps)", f"{avg_spread:.3f}")
-    col4.metric("Max spread (positive, bps)", f"{max_pos_spread:.3f}")
-    col5.metric("Share spread > 0 (%)", f"{positive_share:.1f}")
+    col1.metric("Avg HL funding (bps)", f"{summary['avg_hl']:.3f}")
+    col2.metric("Avg Deriv funding (bps)", f"{summary['avg_derive']:.3f}")
+    col3.metric("Avg spread HL - Deriv (bps)", f"{summary['avg_spread']:.3f}")
+    col4.metric("Max spread (positive, bps)", f"{summary['max_pos_spread']:.3f}")
+    col5.metric("Share spread > 0 (%)", f"{summary['positive_share']:.1f}")
 
     st.markdown("---")
 
     c1, c2 = st.columns(2)
 
     with c1:
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=pair["time"],
-                y=pair["funding_hl_bps"],
-                mode="lines",
-                name="Hyperliquid",
-            )
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=pair["time"],
-                y=pair["funding_derive_bps"],
-                mode="lines",
-                name="Deriv",
-            )
-        )
-        fig.update_layout(
-            title="Funding rates (bps)",
-            xaxis_title="Time",
-            yaxis_title="Funding rate (bps)",
-            hovermode="x unified",
-            template="plotly_white",
-            height=400,
+        fig = go.Figure(layout=_LAYOUT_PAIR_FUNDING)
+        fig.add_traces(
+            [
+                _line_trace(t, pair["funding_hl_bps"].to_numpy(), "Hyperliquid"),
+                _line_trace(t, pair["funding_derive_bps"].to_numpy(), "Deriv"),
+            ]
         )
         st.plotly_chart(fig, width="stretch")
 
     with c2:
-        fig_spread = go.Figure()
-        fig_spread.add_trace(
-            go.Scatter(
-                x=pair["time"],
-                y=pair["spread_hl_derive_bps"],
-                mode="lines",
-                name="HL - Deriv",
-            )
+        fig_spread = go.Figure(layout=_LAYOUT_PAIR_SPREAD)
+        fig_spread.add_traces(
+            [_line_trace(t, pair["spread_hl_derive_bps"].to_numpy(), "HL - Deriv")]
         )
         fig_spread.add_hline(y=0.0, line_width=1, line_dash="dash", line_color="gray")
-        fig_spread.update_layout(
-            title="Funding spread HL - Deriv (bps)",
-            xaxis_title="Time",
-            yaxis_title="Spread (bps)",
-            hovermode="x unified",
-            template="plotly_white",
-            height=400,
-        )
         st.plotly_chart(fig_spread, width="stretch")
 
     st.markdown("---")
     st.subheader("Top spread opportunities (by absolute value)")
 
-    pair["abs_spread"] = pair["spread_hl_derive_bps"].abs()
-    top = (
-        pair[["time", "funding_hl_bps", "funding_derive_bps", "spread_hl_derive_bps", "abs_spread"]]
-        .sort_values("abs_spread", ascending=False)
-        .head(30)
-        .reset_index(drop=True)
-    )
-
-    top.rename(
-        columns={
-            "time": "Time",
-            "funding_hl_bps": "HL funding (bps)",
-            "funding_derive_bps": "Deriv funding (bps)",
-            "spread_hl_derive_bps": "Spread HL - Deriv (bps)",
-            "abs_spread": "Abs spread (bps)",
-        },
-        inplace=True,
-    )
-
-    st.dataframe(top, width="stretch")
+    st.dataframe(summary["top"], width="stretch")
 
 
 def render_all_exchanges_tab(df: pd.DataFrame) -> None:
     """
     All exchanges tab: all funding series and all spreads.
     """
-    has_hl = "funding_hl_bps" in df.columns
-    has_derive = "funding_derive_bps" in df.columns
-    has_binance = "funding_binance_bps" in df.columns
+    columns = frozenset(df.columns)
+    funding_present = [c for c in EXCHANGE_LABELS if c in columns]
+    spread_present = [c for c in SPREAD_LABELS if c in columns]
 
-    if not (has_hl or has_derive or has_binance):
+    if not funding_present:
         st.warning("No funding data available.")
         return
 
     st.subheader("Funding rates by exchange (bps)")
 
-    fig = go.Figure()
-
-    if has_hl:
-        fig.add_trace(
-            go.Scatter(
-                x=df["time"],
-                y=df["funding_hl_bps"],
-                mode="lines",
-                name="Hyperliquid",
-            )
-        )
-    if has_derive:
-        fig.add_trace(
-            go.Scatter(
-                x=df["time"],
-                y=df["funding_derive_bps"],
-                mode="lines",
-                name="Deriv",
-            )
-        )
-    if has_binance:
-        fig.add_trace(
-            go.Scatter(
-                x=df["time"],
-                y=df["funding_binance_bps"],
-                mode="lines",
-                name="Binance",
-            )
-        )
+    t = _time_values(df["time"])
 
-    fig.update_layout(
-        xaxis_title="Time",
-        yaxis_title="Funding rate (bps)",
-        hovermode="x unified",
-        template="plotly_white",
-        height=450,
+    fig = go.Figure(layout=_LAYOUT_ALL_FUNDING)
+    fig.add_traces(
+        [_line_trace(t, df[c].to_numpy(), EXCHANGE_LABELS[c]) for c in funding_present]
     )
 
     st.plotly_chart(fig, width="stretch")
@@ -306,79 +623,32 @@ def render_all_exchanges_tab(df: pd.DataFrame) -> None:
     st.markdown("---")
     st.subheader("Spreads between exchanges (bps)")
 
-    fig_spreads = go.Figure()
-
-    if "spread_hl_derive_bps" in df.columns:
-        fig_spreads.add_trace(
-            go.Scatter(
-                x=df["time"],
-                y=df["spread_hl_derive_bps"],
-                mode="lines",
-                name="HL - Deriv",
-            )
-        )
-    if "spread_hl_binance_bps" in df.columns:
-        fig_spreads.add_trace(
-            go.Scatter(
-                x=df["time"],
-                y=df["spread_hl_binance_bps"],
-                mode="lines",
-                name="HL - Binance",
-            )
-        )
-    if "spread_derive_binance_bps" in df.columns:
-        fig_spreads.add_trace(
-            go.Scatter(
-                x=df["time"],
-                y=df["spread_derive_binance_bps"],
-                mode="lines",
-                name="Deriv - Binance",
-            )
-        )
+    fig_spreads = go.Figure(layout=_LAYOUT_ALL_SPREADS)
+    fig_spreads.add_traces(
+        [_line_trace(t, df[c].to_numpy(), SPREAD_LABELS[c]) for c in spread_present]
+    )
 
     fig_spreads.add_hline(y=0.0, line_width=1, line_dash="dash", line_color="gray")
-    fig_spreads.update_layout(
-        xaxis_title="Time",
-        yaxis_title="Spread (bps)",
-        hovermode="x unified",
-        template="plotly_white",
-        height=450,
-    )
 
     st.plotly_chart(fig_spreads, width="stretch")
 
     st.markdown("---")
     st.subheader("Summary statistics")
 
-    rows = []
+    stats_df = _all_stats(df)
+    st.dataframe(stats_df, width="stretch")
 
-    if has_hl:
-        rows.append(
-            {
-                "Exchange": "Hyperliquid",
-                "Avg funding (bps)": df["funding_hl_bps"].mean(),
-                "Std funding (bps)": df["funding_hl_bps"].std(),
-            }
-        )
-    if has_derive:
-        rows.append(
-            {
-                "Exchange": "Deriv",
-                "Avg funding (bps)": df["funding_derive_bps"].mean(),
-                "Std funding (bps)": df["funding_derive_bps"].std(),
-            }
-        )
-    if has_binance:
-        rows.append(
-            {
-                "Exchange": "Binance",
-                "Avg funding (bps)": df["funding_binance_bps"].mean(),
-                "Std funding (bps)": df["funding_binance_bps"].std(),
-            }
-        )
 
-    stats_df = pd.DataFrame(rows)
-    st.dataframe(stats_df, width="stretch")
+@st.cache_data(
+    show_spinner=False,
+    max_entries=DERIVED_CACHE_ENTRIES,
+    hash_funcs={pd.DataFrame: _frame_fingerprint},
+)
+def _arrow_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Arrow copy of the merged frame for display; st.dataframe sends it as-is.
+    """
+    return pa.Table.from_pandas(df, preserve_index=False)
 
 
 def render_raw_data_tab(df: pd.DataFrame) -> None:
@@ -386,7 +656,7 @@ def render_raw_data_tab(df: pd.DataFrame) -> None:
     Raw data tab for debugging and exploration.
     """
     st.subheader("Merged funding and spread data")
-    st.dataframe(df, width="stretch")
+    st.dataframe(_arrow_table(df), width="stretch")
 
 
 def main() -> None: